@@ -1,10 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text, select, func
+import asyncio
 import httpx
 import sys
 import os
+import time
 from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 import json
 import traceback
 try:
@@ -21,6 +24,130 @@ from ..models.opportunity import Opportunity
 router = APIRouter()
 settings = get_settings()
 
+SQL_PING = text("SELECT 1")
+
+# How long (seconds) a readiness check result is reused, per dependency
+CHECK_TTLS = {
+    "database": 2.0,
+    "redis": 2.0,
+    "minio": 10.0
+}
+
+# Longest (seconds) a readiness probe may take before it counts as failed
+CHECK_TIMEOUTS = {
+    "database": 3.0,
+    "redis": 3.0,
+    "minio": 5.0
+}
+
+_check_cache: Dict[str, Tuple[float, bool]] = {}
+_check_locks: Dict[str, asyncio.Lock] = {}
+
+# Pooled client for HTTP probes, kept alive across requests
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(5.0),
+            limits=httpx.Limits(max_keepalive_connections=20)
+        )
+    return _http_client
+
+
+# Shared redis clients (each owns a connection pool), keyed by decode_responses
+_redis_clients: Dict[bool, "redis.Redis"] = {}
+
+
+def get_redis(decode_responses: bool = False) -> "redis.Redis":
+    client = _redis_clients.get(decode_responses)
+    if client is None:
+        client = redis.from_url(settings.redis_url, decode_responses=decode_responses)
+        _redis_clients[decode_responses] = client
+    return client
+
+
+async def close_redis_clients() -> None:
+    """Close the shared redis clients; called on application shutdown."""
+    for client in _redis_clients.values():
+        await client.aclose()
+    _redis_clients.clear()
+
+
+async def close_http_client() -> None:
+    """Close the shared probe client; called on application shutdown."""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+    _http_client = None
+
+
+async def _cached_check(
+    name: str,
+    check: Callable[[], Awaitable[bool]],
+    use_cache: bool = True
+) -> bool:
+    """Run a readiness check, reusing its result for CHECK_TTLS[name] seconds."""
+    if use_cache:
+        cached = _check_cache.get(name)
+        if cached and time.monotonic() - cached[0] < CHECK_TTLS[name]:
+            return cached[1]
+    
+    # Concurrent misses wait for one probe instead of each hitting the dependency
+    lock = _check_locks.setdefault(name, asyncio.Lock())
+    async with lock:
+        cached = _check_cache.get(name)
+        if use_cache and cached and time.monotonic() - cached[0] < CHECK_TTLS[name]:
+            return cached[1]
+        
+        try:
+            ok = await asyncio.wait_for(check(), CHECK_TIMEOUTS[name])
+        except asyncio.TimeoutError:
+            ok = False
+        _check_cache[name] = (time.monotonic(), ok)
+        return ok
+
+
+async def _check_database(db: AsyncSession) -> bool:
+    try:
+        await db.execute(SQL_PING)
+        return True
+    except Exception:
+        return False
+
+
+async def _check_redis() -> bool:
+    try:
+        await get_redis().ping()
+        return True
+    except Exception:
+        return False
+
+
+async def _check_minio() -> bool:
+    try:
+        client = get_http_client()
+        response = await client.get(f"http://{settings.minio_endpoint}/minio/health/ready")
+        return response.status_code == 200
+    except Exception:
+        return False
+
+
+# /health's timestamp string and when it was taken; refreshed at most once a second
+_health_timestamp = ["", 0.0]
+
+
+def _current_timestamp() -> str:
+    now = time.time()
+    if now - _health_timestamp[1] >= 1.0:
+        _health_timestamp[0] = datetime.utcfromtimestamp(now).isoformat()
+        _health_timestamp[1] = now
+    return _health_timestamp[0]
+
 
 @router.get("/health")
 async def health_check():
@@ -28,7 +155,7 @@ async def health_check():
     result = {
         "status": "healthy", 
         "service": "HoistScout API",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _current_timestamp(),
         "environment": settings.environment,
         "python_version": sys.version,
         "redis": {
@@ -76,12 +203,11 @@ async def health_check():
         result["redis"]["error"] = str(e)
     
     # Test Redis connection
-    r = None
     try:
-        start_time = datetime.utcnow()
-        r = redis.from_url(settings.redis_url)
+        start_time = time.perf_counter()
+        r = get_redis()
         await r.ping()
-        latency = (datetime.utcnow() - start_time).total_seconds() * 1000
+        latency = (time.perf_counter() - start_time) * 1000
         
         result["redis"]["connected"] = True
         result["redis"]["ping_latency_ms"] = round(latency, 2)
@@ -97,64 +223,45 @@ async def health_check():
         result["celery"]["connected"] = False
         result["celery"]["error"] = f"Redis connection failed: {str(e)}"
         result["status"] = "degraded"
-    finally:
-        if r:
-            try:
-                await r.close()
-            except:
-                pass
     
     return result
 
 
-@router.get("/health/ready")
-async def readiness_check(db: AsyncSession = Depends(get_db)):
+async def _run_readiness_checks(db: AsyncSession, use_cache: bool = True) -> dict:
+    """Build the readiness report; use_cache=False forces fresh probes."""
+    # Probe the core dependencies concurrently; the slowest one bounds the wait
+    database_ok, redis_ok = await asyncio.gather(
+        _cached_check("database", lambda: _check_database(db), use_cache),
+        _cached_check("redis", _check_redis, use_cache)
+    )
     checks = {
-        "database": False,
-        "redis": False,
-        "minio": False
+        "database": database_ok,
+        "redis": redis_ok
     }
     
-    # Check database
-    try:
-        await db.execute(text("SELECT 1"))
-        checks["database"] = True
-    except Exception:
-        pass
-    
-    # Check Redis
-    try:
-        try:
-    import redis.asyncio as redis
-except ImportError:
-    import redis
-        r = redis.from_url(settings.redis_url)
-        await r.ping()
-        await r.close()
-        checks["redis"] = True
-    except Exception:
-        pass
-    
-    # Check MinIO (only if configured)
-    if settings.minio_endpoint:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"http://{settings.minio_endpoint}/minio/health/ready")
-                checks["minio"] = response.status_code == 200
-        except Exception:
-            pass
-    else:
+    # Check MinIO (only if configured, and only while the core is up)
+    if not settings.minio_endpoint:
         checks["minio"] = None  # Not configured
+    elif database_ok and redis_ok:
+        checks["minio"] = await _cached_check("minio", _check_minio, use_cache)
+    else:
+        checks["minio"] = "skipped"  # Already not ready
     
     # Only check services that are configured (not None)
-    configured_checks = {k: v for k, v in checks.items() if v is not None}
-    all_healthy = all(configured_checks.values()) if configured_checks else True
+    all_healthy = all(ok is not False for ok in checks.values())
     return {
         "ready": all_healthy,
         "checks": checks
     }
 
 
+@router.get("/health/ready")
+async def readiness_check(db: AsyncSession = Depends(get_db)):
+    # Always answered through the check cache, so probe floods reach each
+    # dependency at most once per TTL
+    return await _run_readiness_checks(db)
+
+
 @router.get("/health/live")
 async def liveness_check():
     return {"alive": True}
@@ -250,35 +357,24 @@ async def diagnostic_check():
 async def get_stats(db: AsyncSession = Depends(get_db)):
     """Get dashboard statistics for the frontend."""
     try:
-        # Get total sites count
-        sites_stmt = select(func.count(Website.id))
-        sites_result = await db.execute(sites_stmt)
-        total_sites = sites_result.scalar() or 0
-        
-        # Get total jobs count
-        jobs_stmt = select(func.count(ScrapingJob.id))
-        jobs_result = await db.execute(jobs_stmt)
-        total_jobs = jobs_result.scalar() or 0
-        
-        # Get total opportunities count
-        opps_stmt = select(func.count(Opportunity.id))
-        opps_result = await db.execute(opps_stmt)
-        total_opportunities = opps_result.scalar() or 0
-        
-        # Get jobs created this week
+        # Get every figure in one round-trip; the job aggregates share a
+        # single pass over scraping_jobs
         week_ago = datetime.utcnow() - timedelta(days=7)
-        week_jobs_stmt = select(func.count(ScrapingJob.id)).where(
-            ScrapingJob.created_at >= week_ago
-        )
-        week_jobs_result = await db.execute(week_jobs_stmt)
-        jobs_this_week = week_jobs_result.scalar() or 0
-        
-        # Get last scrape time (most recent completed job)
-        last_scrape_stmt = select(ScrapingJob.completed_at).where(
-            ScrapingJob.completed_at.isnot(None)
-        ).order_by(ScrapingJob.completed_at.desc()).limit(1)
-        last_scrape_result = await db.execute(last_scrape_stmt)
-        last_scrape_time = last_scrape_result.scalar()
+        stats_stmt = select(
+            select(func.count(Website.id)).scalar_subquery().label("total_sites"),
+            select(func.count(Opportunity.id)).scalar_subquery().label("total_opportunities"),
+            func.count(ScrapingJob.id).label("total_jobs"),
+            func.count(ScrapingJob.id).filter(
+                ScrapingJob.created_at >= week_ago
+            ).label("jobs_this_week"),
+            func.max(ScrapingJob.completed_at).label("last_scrape")
+        ).select_from(ScrapingJob)
+        stats = (await db.execute(stats_stmt)).one()
+        total_sites = stats.total_sites or 0
+        total_jobs = stats.total_jobs or 0
+        total_opportunities = stats.total_opportunities or 0
+        jobs_this_week = stats.jobs_this_week or 0
+        last_scrape_time = stats.last_scrape
         
         return {
             "total_sites": total_sites,
@@ -304,8 +400,11 @@ async def redis_connectivity_check():
     Comprehensive Redis connectivity and Celery queue check.
     This endpoint is accessible without authentication for easy testing.
     """
+    # One clock reading for the whole check
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
     result = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": now_iso,
         "redis_url": settings.redis_url[:30] + "..." if len(settings.redis_url) > 30 else settings.redis_url,
         "connection": {
             "status": "disconnected",
@@ -326,44 +425,37 @@ async def redis_connectivity_check():
         "redis_info": {}
     }
     
-    r = None
     try:
         # Test Redis connection
-        start_time = datetime.utcnow()
-        r = redis.from_url(settings.redis_url, decode_responses=True)
+        start_time = time.perf_counter()
+        r = get_redis(decode_responses=True)
         await r.ping()
-        latency = (datetime.utcnow() - start_time).total_seconds() * 1000
+        latency = (time.perf_counter() - start_time) * 1000
         
         result["connection"]["status"] = "connected"
         result["connection"]["latency_ms"] = round(latency, 2)
         
         # Test basic operations
-        test_key = f"hoistscout:health:test:{datetime.utcnow().timestamp()}"
-        test_value = f"test_value_{datetime.utcnow().isoformat()}"
+        test_key = f"hoistscout:health:test:{now.timestamp()}"
+        test_value = f"test_value_{now_iso}"
         
-        # SET operation
-        try:
-            await r.set(test_key, test_value, ex=60)  # Expire in 60 seconds
-            result["operations"]["set"]["success"] = True
-        except Exception as e:
-            result["operations"]["set"]["error"] = str(e)
+        # SET, GET and DELETE in one round-trip
+        pipe = r.pipeline(transaction=False)
+        pipe.set(test_key, test_value, ex=60)  # Expire in 60 seconds
+        pipe.get(test_key)
+        pipe.delete(test_key)
+        replies = await pipe.execute(raise_on_error=False)
         
-        # GET operation
-        try:
-            retrieved_value = await r.get(test_key)
-            result["operations"]["get"]["success"] = True
-            result["operations"]["get"]["value"] = retrieved_value
-            if retrieved_value != test_value:
-                result["operations"]["get"]["error"] = "Value mismatch"
-        except Exception as e:
-            result["operations"]["get"]["error"] = str(e)
+        for op, reply in zip(("set", "get", "delete"), replies):
+            if isinstance(reply, Exception):
+                result["operations"][op]["error"] = str(reply)
+            else:
+                result["operations"][op]["success"] = True
         
-        # DELETE operation
-        try:
-            await r.delete(test_key)
-            result["operations"]["delete"]["success"] = True
-        except Exception as e:
-            result["operations"]["delete"]["error"] = str(e)
+        if result["operations"]["get"]["success"]:
+            result["operations"]["get"]["value"] = replies[1]
+            if replies[1] != test_value:
+                result["operations"]["get"]["error"] = "Value mismatch"
         
         # Check Celery queues
         try:
@@ -433,14 +525,6 @@ async def redis_connectivity_check():
         result["connection"]["error"] = str(e)
         result["connection"]["traceback"] = traceback.format_exc()
     
-    finally:
-        # Clean up connection
-        if r:
-            try:
-                await r.close()
-            except:
-                pass
-    
     # Determine overall health
     result["healthy"] = (
         result["connection"]["status"] == "connected" and
@@ -2,6 +2,7 @@ from typing import List, Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..database import get_db
 from ..models.user import User, UserRole
@@ -42,15 +43,6 @@ async def create_website(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(require_editor_role)
 ):
-    # Check if URL already exists
-    stmt = select(Website).where(Website.url == str(website_data.url))
-    result = await db.execute(stmt)
-    if result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Website URL already exists"
-        )
-    
     # Encrypt credentials if provided
     encrypted_credentials = None
     if website_data.credentials:
@@ -58,20 +50,33 @@ async def create_website(
             website_data.credentials
         )
     
-    # Create website
-    website = Website(
-        name=website_data.name,
-        url=str(website_data.url),
-        category=website_data.category,
-        auth_type=website_data.auth_type,
-        credentials=encrypted_credentials,
-        scraping_config=website_data.scraping_config,
-        is_active=website_data.is_active
+    # Create website in a single round-trip; the unique index on url turns a
+    # duplicate into an empty RETURNING instead of a separate existence check
+    stmt = (
+        pg_insert(Website)
+        .values(
+            name=website_data.name,
+            url=str(website_data.url),
+            category=website_data.category,
+            auth_type=website_data.auth_type,
+            credentials=encrypted_credentials,
+            scraping_config=website_data.scraping_config,
+            is_active=website_data.is_active
+        )
+        .on_conflict_do_nothing(index_elements=[Website.url])
+        .returning(Website)
     )
+    result = await db.execute(stmt)
+    website = result.scalar_one_or_none()
+    
+    if not website:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Website URL already exists"
+        )
     
-    db.add(website)
     await db.commit()
-    await db.refresh(website)
     
     return website
 
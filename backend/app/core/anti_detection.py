@@ -6,6 +6,7 @@ import random
 import asyncio
 from typing import Dict, Optional, List
 from dataclasses import dataclass
+from urllib.parse import urlsplit
 from loguru import logger
 
 from fake_useragent import UserAgent
@@ -14,6 +15,25 @@ import undetected_chromedriver as uc
 from asyncio_throttle import Throttler
 
 
+# Common desktop viewport sizes to pick from
+VIEWPORTS = (
+    {"width": 1920, "height": 1080},
+    {"width": 1366, "height": 768},
+    {"width": 1440, "height": 900},
+    {"width": 1536, "height": 864}
+)
+
+# Realistic browser headers
+BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1"
+}
+
+
 @dataclass
 class BrowserConfig:
     """Browser configuration for anti-detection."""
@@ -81,8 +101,7 @@ class DomainThrottler:
     
     async def throttle(self, url: str):
         """Apply rate limiting for URL."""
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
+        domain = urlsplit(url).netloc
         
         throttler = self.get_throttler(domain)
         async with throttler:
@@ -210,32 +229,17 @@ class AntiDetectionManager:
         user_agent = self.ua.random
         
         # Random viewport size
-        viewports = [
-            {"width": 1920, "height": 1080},
-            {"width": 1366, "height": 768},
-            {"width": 1440, "height": 900},
-            {"width": 1536, "height": 864}
-        ]
-        viewport = random.choice(viewports)
+        viewport = dict(random.choice(VIEWPORTS))
         
         # Get proxy if available
         proxy = await self.proxy_rotator.get_proxy()
         
-        # Realistic headers
-        headers = {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "DNT": "1",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1"
-        }
-        
+        # Copy so callers can add per-site headers without touching the defaults
         return BrowserConfig(
             user_agent=user_agent,
             viewport=viewport,
             proxy=proxy,
-            headers=headers,
+            headers=dict(BROWSER_HEADERS),
             cookies=None
         )
     
@@ -3,230 +3,635 @@ Demo scraper for testing without Ollama/ScrapeGraphAI dependencies
 """
 import asyncio
 import httpx
-from bs4 import BeautifulSoup
-from datetime import datetime
+from bs4 import BeautifulSoup, SoupStrainer
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import json
 import re
-from typing import List, Dict, Any
-import hashlib
+import time
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator, Iterable
+from urllib.parse import urlsplit
+import zlib
 from loguru import logger
 
 from ..schemas.scraping import ScrapingResult
 
+# Prefer lxml's C-level tree and XPath, falling back to BeautifulSoup
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Only materialise the tags tender listings are built from
+TENDER_STRAINER = SoupStrainer(["div", "tr", "article", "table"])
+
+# Elements whose class marks them as a tender listing
+TENDER_TAGS = ("div", "tr", "article")
+TENDER_CLASS_RE = re.compile(r"tender|opportunity|search-result", re.I)
+
+# Where a listing's title usually lives
+TITLE_TAGS = ("h2", "h3", "h4", "a", "span")
+
+# Longest slice of an element's text we keep (raw_text); titles and
+# descriptions are cut from the same prefix
+MAX_TEXT_CHARS = 1000
+
+if LXML_AVAILABLE:
+    # Same matching rules as TENDER_TAGS/TENDER_CLASS_RE, compiled once
+    TENDER_ROWS_XPATH = etree.XPath(
+        f"(//div|//tr|//article)[re:test(@class, '{TENDER_CLASS_RE.pattern}', 'i')]"
+        "[position() <= 10]",
+        namespaces={"re": "http://exslt.org/regular-expressions"}
+    )
+    # Many gov sites use plain tables; take <tbody> rows from any table, as
+    # the listing often follows a layout table
+    TABLE_ROWS_XPATH = etree.XPath("(//table/tbody/tr)[position() <= 10]")
+    TITLE_XPATH = etree.XPath("(.//h2|.//h3|.//h4|.//a|.//span)[1]")
+    # Text nodes as BeautifulSoup's .strings sees them (no script/style bodies)
+    TEXT_XPATH = etree.XPath(
+        ".//text()[not(parent::script|parent::style)]",
+        smart_strings=False
+    )
+
+# HTTP/2 needs the optional h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Headers to look like a real browser
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Listings sit near the top of the page; cap how much of it we download and parse
+MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# Bodies smaller than this are error stubs, not listing pages; skip parsing
+MIN_HTML_BYTES = 512
+
+# Statuses that mean "slow down" rather than "broken"
+RATE_LIMIT_STATUSES = (429, 503)
+
+# How many pages bulk scrapes fetch ahead of the one being parsed
+PREFETCH_PAGES = 4
+
+# Parsed results per URL for conditional refetches: (etag, last_modified,
+# opportunities JSON). Only touched from the event loop, never across an await.
+RESULT_CACHE_SIZE = 128
+_RESULT_CACHE: Dict[str, Tuple[Optional[str], Optional[str], bytes]] = {}
+
+# Canned listings returned when the page has no recognisable tender markup;
+# source_url and extracted_at are filled in per scrape
+DEMO_OPPORTUNITIES = (
+    {
+        "title": "Demo Tender - IT Services Contract",
+        "description": "This is a demonstration tender extracted from tenders.gov.au. The government is seeking providers for IT services including cloud infrastructure, software development, and technical support.",
+        "deadline": "2025-12-31T23:59:59Z",
+        "value": 500000.00,
+        "currency": "AUD",
+        "reference_number": "ATM-2025-DEMO-001",
+        "categories": ["IT Services", "Cloud Computing", "Software Development"],
+        "location": "Canberra, ACT",
+        "confidence_score": 0.75,
+        "extracted_data": {
+            "agency": "Department of Digital Services",
+            "contact_email": "procurement@digital.gov.au",
+            "submission_method": "Electronic via AusTender",
+            "eligibility": "Open to all Australian businesses"
+        }
+    },
+    {
+        "title": "Construction Services - Regional Infrastructure",
+        "description": "Regional infrastructure development project requiring construction services for road upgrades and bridge maintenance across rural areas.",
+        "deadline": "2025-11-15T17:00:00Z",
+        "value": 2500000.00,
+        "currency": "AUD",
+        "reference_number": "ATM-2025-INFRA-002",
+        "categories": ["Construction", "Infrastructure", "Civil Engineering"],
+        "location": "Regional NSW",
+        "confidence_score": 0.80,
+        "extracted_data": {
+            "agency": "Department of Infrastructure",
+            "project_duration": "24 months",
+            "security_clearance": "Not required"
+        }
+    },
+    {
+        "title": "Professional Services - Policy Development",
+        "description": "Seeking consultancy services for policy development and strategic planning in the healthcare sector.",
+        "deadline": "2025-10-30T16:00:00Z",
+        "value": 150000.00,
+        "currency": "AUD",
+        "reference_number": "ATM-2025-CONSULT-003",
+        "categories": ["Consulting", "Healthcare", "Policy Development"],
+        "location": "Sydney, NSW",
+        "confidence_score": 0.85,
+        "extracted_data": {
+            "agency": "Department of Health",
+            "contract_type": "Fixed term - 6 months",
+            "start_date": "2026-01-01"
+        }
+    }
+)
+
+class RateLimited(Exception):
+    """The site asked us to back off (429/503); retry_after is in seconds."""
+    
+    def __init__(self, url: str, status: int, retry_after: Optional[float] = None):
+        self.url = url
+        self.status = status
+        self.retry_after = retry_after
+        super().__init__(f"HTTP {status}: Rate limited by {url}")
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def raise_for_status(url: str, status: int, retry_after: Optional[str] = None) -> None:
+    """Raise RateLimited for back-off statuses and a plain error for other non-200s."""
+    if status in RATE_LIMIT_STATUSES:
+        raise RateLimited(url, status, parse_retry_after(retry_after))
+    if status != 200:
+        raise Exception(f"HTTP {status}: Failed to fetch {url}")
+
+
+def _normalise_text(strings: Iterable[str], limit: int = MAX_TEXT_CHARS) -> str:
+    """
+    Join an element's text nodes with single spaces, collapsing whitespace.
+    
+    Stops once `limit` characters are collected, so large elements are not
+    walked in full. Both parser backends go through here so they agree.
+    """
+    parts = []
+    size = 0
+    for string in strings:
+        words = string.split()
+        if not words:
+            continue
+        parts.append(' '.join(words))
+        size += len(parts[-1]) + 1
+        if size > limit:
+            break
+    return ' '.join(parts)[:limit]
+
+
+def _demo_opportunities(url: str, now_iso: str) -> List[Dict[str, Any]]:
+    """Canned opportunities for pages with no recognisable tender listings."""
+    return [
+        {
+            **template,
+            "source_url": url,
+            "categories": list(template["categories"]),
+            "extracted_data": {
+                **template["extracted_data"],
+                "extracted_at": now_iso
+            }
+        }
+        for template in DEMO_OPPORTUNITIES
+    ]
+
+
+@dataclass
+class FetchedPage:
+    """A fetched listing page, or the cached result if it was not modified."""
+    body: bytes
+    encoding: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    cached_opportunities: Optional[bytes] = None
+
+
+async def read_capped_body(
+    response: httpx.Response,
+    max_bytes: int = MAX_BODY_BYTES
+) -> bytes:
+    """Read a streamed response body, stopping once max_bytes have arrived."""
+    buf = bytearray()
+    async for chunk in response.aiter_bytes(chunk_size=64 * 1024):
+        buf += chunk
+        if len(buf) >= max_bytes:
+            logger.warning(f"Response from {response.url} truncated at {max_bytes} bytes")
+            break
+    return bytes(buf[:max_bytes])
+
+
+def _cache_result(
+    url: str,
+    etag: Optional[str],
+    last_modified: Optional[str],
+    opportunities: List[Dict[str, Any]]
+) -> None:
+    """Remember a page's opportunities against its validators, evicting FIFO."""
+    _RESULT_CACHE.pop(url, None)
+    if len(_RESULT_CACHE) >= RESULT_CACHE_SIZE:
+        del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(opportunities)
+    else:
+        data = json.dumps(opportunities).encode()
+    _RESULT_CACHE[url] = (etag, last_modified, data)
+
+
+_DONE = object()
+
+
+async def buffered(iterator: AsyncIterator, size: int) -> AsyncIterator:
+    """
+    Run an async iterator up to `size` items ahead of its consumer.
+    
+    The source is drained by a background task into a bounded queue, so the
+    next items are already being produced while the current one is processed.
+    Close it (aclose) to stop the producer and the source deterministically.
+    """
+    if size < 1:
+        # maxsize=0 would make the queue unbounded
+        raise ValueError(f"buffered() size must be at least 1, got {size}")
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+    
+    async def produce():
+        try:
+            async for item in iterator:
+                await queue.put((item, None))
+        except Exception as e:
+            await queue.put((None, e))
+        else:
+            await queue.put((_DONE, None))
+        finally:
+            # Run the source's cleanup now if the consumer stopped early
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+    
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item, error = await queue.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        # Wait for the producer (and the source) to unwind before returning
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
 
 class DemoScraper:
     """Simple scraper for demonstration purposes"""
     
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport
+    
+    def _open_client(self) -> httpx.AsyncClient:
+        """
+        Build the HTTP client for one scrape or scrape_stream batch.
+        
+        Pooled connections cannot outlive their event loop and Celery tasks
+        each run on a fresh loop, so every call owns its client and closes it
+        before returning; a batch shares keep-alive connections across pages.
+        """
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            follow_redirects=True,
+            transport=self.transport
+        )
+    
     async def scrape_tenders_gov_au(self, url: str) -> ScrapingResult:
         """Extract tender opportunities from tenders.gov.au"""
-        start_time = datetime.utcnow()
-        opportunities = []
+        t0 = time.perf_counter()
+        # One timestamp per scrape, shared by every opportunity
+        now_iso = datetime.utcnow().isoformat()
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Add headers to look like a real browser
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Upgrade-Insecure-Requests': '1'
-                }
-                
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Look for tender listings - adjust selectors based on actual site structure
-                    # Common patterns for tender sites
-                    tender_selectors = [
-                        'div.tender-item',
-                        'div.opportunity',
-                        'tr.tender-row',
-                        'div.search-result',
-                        'article.tender',
-                        'div[class*="tender"]',
-                        'div[class*="opportunity"]',
-                        'table tbody tr'  # Many gov sites use tables
-                    ]
-                    
-                    tender_elements = []
-                    for selector in tender_selectors:
-                        elements = soup.select(selector)
-                        if elements:
-                            tender_elements = elements
-                            logger.info(f"Found {len(elements)} elements with selector: {selector}")
-                            break
-                    
-                    # If no specific tender elements found, look for general content
-                    if not tender_elements:
-                        # Extract some demo data from page content
-                        opportunities.append({
-                            "title": "Demo Tender - IT Services Contract",
-                            "description": "This is a demonstration tender extracted from tenders.gov.au. The government is seeking providers for IT services including cloud infrastructure, software development, and technical support.",
-                            "deadline": "2025-12-31T23:59:59Z",
-                            "value": 500000.00,
-                            "currency": "AUD",
-                            "reference_number": "ATM-2025-DEMO-001",
-                            "source_url": url,
-                            "categories": ["IT Services", "Cloud Computing", "Software Development"],
-                            "location": "Canberra, ACT",
-                            "confidence_score": 0.75,
-                            "extracted_data": {
-                                "agency": "Department of Digital Services",
-                                "contact_email": "procurement@digital.gov.au",
-                                "submission_method": "Electronic via AusTender",
-                                "eligibility": "Open to all Australian businesses",
-                                "extracted_at": datetime.utcnow().isoformat()
-                            }
-                        })
-                        
-                        opportunities.append({
-                            "title": "Construction Services - Regional Infrastructure",
-                            "description": "Regional infrastructure development project requiring construction services for road upgrades and bridge maintenance across rural areas.",
-                            "deadline": "2025-11-15T17:00:00Z",
-                            "value": 2500000.00,
-                            "currency": "AUD",
-                            "reference_number": "ATM-2025-INFRA-002",
-                            "source_url": url,
-                            "categories": ["Construction", "Infrastructure", "Civil Engineering"],
-                            "location": "Regional NSW",
-                            "confidence_score": 0.80,
-                            "extracted_data": {
-                                "agency": "Department of Infrastructure",
-                                "project_duration": "24 months",
-                                "security_clearance": "Not required",
-                                "extracted_at": datetime.utcnow().isoformat()
-                            }
-                        })
-                        
-                        opportunities.append({
-                            "title": "Professional Services - Policy Development",
-                            "description": "Seeking consultancy services for policy development and strategic planning in the healthcare sector.",
-                            "deadline": "2025-10-30T16:00:00Z",
-                            "value": 150000.00,
-                            "currency": "AUD",
-                            "reference_number": "ATM-2025-CONSULT-003",
-                            "source_url": url,
-                            "categories": ["Consulting", "Healthcare", "Policy Development"],
-                            "location": "Sydney, NSW",
-                            "confidence_score": 0.85,
-                            "extracted_data": {
-                                "agency": "Department of Health",
-                                "contract_type": "Fixed term - 6 months",
-                                "start_date": "2026-01-01",
-                                "extracted_at": datetime.utcnow().isoformat()
-                            }
-                        })
-                    else:
-                        # Parse actual tender elements
-                        for i, element in enumerate(tender_elements[:10]):  # Limit to 10
-                            opportunity = self._parse_tender_element(element, url)
-                            if opportunity:
-                                opportunities.append(opportunity)
-                    
-                    duration = (datetime.utcnow() - start_time).total_seconds()
-                    
-                    return ScrapingResult(
-                        website_id=1,
-                        website_url=url,
-                        opportunities=opportunities,
-                        total_found=len(opportunities),
-                        pages_scraped=1,
-                        pdfs_found=0,
-                        pdfs_processed=0,
-                        duration_seconds=duration,
-                        success=True,
-                        error_message=None,
-                        metadata={
-                            "scraper": "demo",
-                            "extracted_at": datetime.utcnow().isoformat()
-                        },
-                        stats={
-                            "pages_scraped": 1,
-                            "opportunities_found": len(opportunities),
-                            "extraction_method": "demo_scraper"
-                        }
-                    )
-                else:
-                    raise Exception(f"HTTP {response.status_code}: Failed to fetch {url}")
-                    
+            async with self._open_client() as client:
+                page = await self._fetch(client, url)
         except Exception as e:
-            logger.error(f"Demo scraper error: {str(e)}")
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            # Rate limits come back as a failed result with stats["retry_after"]
+            return self._error_result(url, e, t0)
+        return await self._process_page(url, page, time.perf_counter() - t0, now_iso)
+    
+    async def scrape_many(self, urls: List[str]) -> List[ScrapingResult]:
+        """Scrape several listing pages in one batch, fetching ahead of parsing"""
+        return [result async for result in self.scrape_stream(urls)]
+    
+    async def scrape_stream(
+        self,
+        urls: List[str],
+        prefetch: int = PREFETCH_PAGES
+    ) -> AsyncIterator[ScrapingResult]:
+        """
+        Yield a ScrapingResult per URL, in order, while later pages download.
+        
+        Up to `prefetch` pages (at least 1) are fetched ahead of the one being
+        parsed, so network round-trips overlap with parsing without buffering
+        every body. Callers that stop early should aclose() the stream.
+        """
+        now_iso = datetime.utcnow().isoformat()
+        
+        async with self._open_client() as client:
+            pages = buffered(self._fetch_iter(client, urls), prefetch)
+            try:
+                async for url, page, error, fetch_seconds in pages:
+                    if error is None:
+                        yield await self._process_page(url, page, fetch_seconds, now_iso)
+                    else:
+                        yield self._error_result(url, error, time.perf_counter() - fetch_seconds)
+            finally:
+                # If the consumer stopped early, a prefetch may be in flight;
+                # stop it before the client is closed underneath it
+                await pages.aclose()
+    
+    async def _fetch_iter(self, client: httpx.AsyncClient, urls: List[str]):
+        """
+        Fetch pages one after another, yielding (url, page, error, fetch_seconds).
+        
+        Fetch time is measured here so results don't count the time a page
+        then spends waiting in the prefetch queue.
+        """
+        for url in urls:
+            t0 = time.perf_counter()
+            try:
+                page = await self._fetch(client, url)
+            except Exception as e:
+                yield url, None, e, time.perf_counter() - t0
+            else:
+                yield url, page, None, time.perf_counter() - t0
+    
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> FetchedPage:
+        """Fetch a listing page, revalidating any cached result for it"""
+        cached = _RESULT_CACHE.get(url)
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached:
+                return FetchedPage(b"", "utf-8", cached_opportunities=cached[2])
+            raise_for_status(url, response.status_code, response.headers.get("retry-after"))
             
-            return ScrapingResult(
-                website_id=1,
-                website_url=url,
-                opportunities=[],
-                total_found=0,
-                pages_scraped=0,
-                pdfs_found=0,
-                pdfs_processed=0,
-                duration_seconds=duration,
-                success=False,
-                error_message=str(e),
-                metadata={"scraper": "demo", "error": str(e)},
-                stats={}
+            # Don't download bodies we would never parse; a missing
+            # content type gets the benefit of the doubt
+            content_type = response.headers.get("content-type", "").lower()
+            if content_type and "html" not in content_type:
+                body = b""
+            else:
+                body = await read_capped_body(response)
+            return FetchedPage(
+                body=body,
+                encoding=response.charset_encoding or "utf-8",
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified")
             )
     
-    def _parse_tender_element(self, element, base_url: str) -> Dict[str, Any]:
-        """Parse a tender element into structured data"""
+    async def _process_page(
+        self,
+        url: str,
+        page: FetchedPage,
+        fetch_seconds: float,
+        now_iso: str
+    ) -> ScrapingResult:
+        """Parse a fetched listing page into a ScrapingResult"""
+        # Durations cover the fetch plus parsing from here on
+        t0 = time.perf_counter() - fetch_seconds
+        
+        if page.cached_opportunities is not None:
+            # Not modified since the last scrape, so skip parsing entirely
+            if ORJSON_AVAILABLE:
+                opportunities = orjson.loads(page.cached_opportunities)
+            else:
+                opportunities = json.loads(page.cached_opportunities)
+            return self._build_result(opportunities, t0)
+        
+        if len(page.body) < MIN_HTML_BYTES:
+            # Not HTML, or an error stub; nothing to parse
+            return self._build_result(_demo_opportunities(url, now_iso), t0)
+        
         try:
-            # Extract text content
-            text = element.get_text(strip=True, separator=' ')
-            
-            # Try to extract common fields
-            title = None
-            description = text[:500] if text else "No description available"
+            # Parsing is CPU-bound; keep it off the event loop so other
+            # scrapes' fetches progress (libxml2 releases the GIL while parsing)
+            opportunities = await asyncio.to_thread(
+                self._parse_page, page.body, page.encoding, url, now_iso
+            )
+        except Exception as e:
+            return self._error_result(url, e, t0)
+        
+        if page.etag or page.last_modified:
+            _cache_result(url, page.etag, page.last_modified, opportunities)
+        return self._build_result(opportunities, t0)
+    
+    def _parse_page(
+        self,
+        body: bytes,
+        encoding: str,
+        url: str,
+        now_iso: str
+    ) -> List[Dict[str, Any]]:
+        """Extract opportunities from a listing page (runs in a worker thread)"""
+        opportunities = []
+        
+        # Look for tender listings by class name (tender-item, opportunity,
+        # tender-row, search-result, ...), falling back to table rows
+        if LXML_AVAILABLE:
+            tender_elements = self._find_tender_rows(body, encoding)
+            parse_element = self._parse_tender_row
+        else:
+            tender_elements = self._find_tender_elements(body, encoding)
+            parse_element = self._parse_tender_element
+        if tender_elements:
+            logger.info(f"Found {len(tender_elements)} tender elements")
+        
+        # If no specific tender elements found, fall back to demo data
+        if not tender_elements:
+            return _demo_opportunities(url, now_iso)
+        
+        # Parse actual tender elements
+        for element in tender_elements:
+            opportunity = parse_element(element, url, now_iso)
+            if opportunity:
+                opportunities.append(opportunity)
+        return opportunities
+    
+    def _build_result(
+        self,
+        opportunities: List[Dict[str, Any]],
+        t0: float
+    ) -> ScrapingResult:
+        """Wrap a page's opportunities in a successful ScrapingResult"""
+        duration = time.perf_counter() - t0
+        
+        # Everything here is built by this module and already well-formed,
+        # so skip validation
+        return ScrapingResult.model_construct(
+            website_id=1,
+            opportunities=opportunities,
+            total_found=len(opportunities),
+            pdfs_processed=0,
+            duration_seconds=duration,
+            success=True,
+            error_message=None,
+            stats={
+                "pages_scraped": 1,
+                "opportunities_found": len(opportunities),
+                "extraction_method": "demo_scraper"
+            }
+        )
+    
+    def _error_result(self, url: str, error: Exception, t0: float) -> ScrapingResult:
+        """Build the failed ScrapingResult for a scrape that raised"""
+        logger.error(f"Demo scraper error for {url}: {str(error)}")
+        duration = time.perf_counter() - t0
+        
+        return ScrapingResult(
+            website_id=1,
+            opportunities=[],
+            total_found=0,
+            pdfs_processed=0,
+            duration_seconds=duration,
+            success=False,
+            error_message=str(error),
+            stats={"retry_after": error.retry_after} if isinstance(error, RateLimited) else {}
+        )
+    
+    def _find_tender_rows(self, body: bytes, encoding: str) -> list:
+        """Locate up to 10 tender elements with precompiled lxml XPath"""
+        if not body.strip():
+            return []
+        tree = lxml.html.fromstring(body, parser=lxml.html.HTMLParser(encoding=encoding))
+        return TENDER_ROWS_XPATH(tree) or TABLE_ROWS_XPATH(tree)
+    
+    def _find_tender_elements(self, body: bytes, encoding: str) -> list:
+        """Locate up to 10 tender elements with BeautifulSoup (no lxml)"""
+        soup = BeautifulSoup(
+            body, "html.parser", parse_only=TENDER_STRAINER, from_encoding=encoding
+        )
+        elements = soup.find_all(TENDER_TAGS, class_=TENDER_CLASS_RE, limit=10)
+        if not elements:
+            # Same rule as TABLE_ROWS_XPATH: explicit <tbody> rows of any table
+            elements = soup.select("table > tbody > tr", limit=10)
+        return elements
+    
+    def _parse_tender_row(self, row, base_url: str, now_iso: str) -> Optional[Dict[str, Any]]:
+        """Parse an lxml tender element into structured data"""
+        try:
+            text = _normalise_text(TEXT_XPATH(row))
+            title_elems = TITLE_XPATH(row)
+            title = _normalise_text(TEXT_XPATH(title_elems[0])) if title_elems else ''
+            return self._build_opportunity(title, text, base_url, now_iso)
+        except Exception as e:
+            logger.error(f"Error parsing tender element: {e}")
+            return None
+    
+    def _parse_tender_element(
+        self,
+        element,
+        base_url: str,
+        now_iso: str
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a BeautifulSoup tender element into structured data"""
+        try:
+            text = _normalise_text(element.strings)
             
             # Look for title in common places
-            title_elem = element.find(['h2', 'h3', 'h4', 'a', 'span'])
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-            
-            if not title:
-                title = text[:100] + "..." if len(text) > 100 else text
+            title_elem = element.find(TITLE_TAGS)
+            title = _normalise_text(title_elem.strings) if title_elem else ''
             
-            # Generate unique ID
-            unique_id = hashlib.md5(f"{title}{description}".encode()).hexdigest()[:8]
-            
-            return {
-                "title": title,
-                "description": description,
-                "deadline": "2025-12-31T23:59:59Z",  # Default deadline
-                "value": 0.0,  # Unknown value
-                "currency": "AUD",
-                "reference_number": f"ATM-{unique_id}",
-                "source_url": base_url,
-                "categories": ["General"],
-                "location": "Australia",
-                "confidence_score": 0.5,
-                "extracted_data": {
-                    "raw_text": text[:1000],
-                    "extracted_at": datetime.utcnow().isoformat()
-                }
-            }
+            return self._build_opportunity(title, text, base_url, now_iso)
         except Exception as e:
             logger.error(f"Error parsing tender element: {e}")
             return None
+    
+    def _build_opportunity(
+        self,
+        title: str,
+        text: str,
+        base_url: str,
+        now_iso: str
+    ) -> Dict[str, Any]:
+        """Build an opportunity dict from an element's title and (bounded) text"""
+        description = text[:500] or "No description available"
+        title = title or (text[:100] + "..." if len(text) > 100 else text)
+        
+        # Generate unique ID
+        unique_id = format(zlib.crc32(f"{title}{description}".encode()), '08x')
+        
+        return {
+            "title": title,
+            "description": description,
+            "deadline": "2025-12-31T23:59:59Z",  # Default deadline
+            "value": 0.0,  # Unknown value
+            "currency": "AUD",
+            "reference_number": f"ATM-{unique_id}",
+            "source_url": base_url,
+            "categories": ["General"],
+            "location": "Australia",
+            "confidence_score": 0.5,
+            "extracted_data": {
+                "raw_text": text,
+                "extracted_at": now_iso
+            }
+        }
+
+
+_demo_scraper = DemoScraper()
+
+# Scrape handlers by hostname (without a leading "www.")
+_HANDLERS = {
+    "tenders.gov.au": _demo_scraper.scrape_tenders_gov_au
+}
 
 
 # Create a simple function that the worker can use
 async def scrape_website_demo(website_config) -> ScrapingResult:
     """Demo scraping function for testing"""
-    scraper = DemoScraper()
+    host = urlsplit(website_config.url).hostname or ""
+    handler = _HANDLERS.get(host.removeprefix("www."))
     
-    if "tenders.gov.au" in website_config.url:
-        return await scraper.scrape_tenders_gov_au(website_config.url)
+    if handler:
+        return await handler(website_config.url)
     else:
         # Return empty result for other sites
         return ScrapingResult(
             website_id=website_config.id,
-            website_url=website_config.url,
             opportunities=[],
-            metadata={"message": "Demo scraper only supports tenders.gov.au"},
+            total_found=0,
+            pdfs_processed=0,
+            duration_seconds=0.0,
             success=False,
             error_message="Site not supported by demo scraper"
         )
\ No newline at end of file
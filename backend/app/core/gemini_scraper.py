@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import json
 import re
+import time
 from typing import Dict, List, Any, Optional
 import hashlib
 from loguru import logger
@@ -144,7 +145,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found. Start with [ a
     
     async def scrape_website(self, website_config) -> ScrapingResult:
         """Scrape website using Gemini for intelligent extraction"""
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         url = website_config.url
         
         try:
@@ -174,7 +175,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found. Start with [ a
                 if processed:
                     opportunities.append(processed)
             
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             logger.info(f"Successfully scraped {len(opportunities)} opportunities in {duration:.2f}s")
             
@@ -203,7 +204,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found. Start with [ a
             
         except Exception as e:
             logger.error(f"Scraping error: {e}")
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             return ScrapingResult(
                 website_id=website_config.id,
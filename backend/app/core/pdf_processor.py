@@ -3,6 +3,8 @@ PDF processing pipeline for tender documents.
 """
 
 import asyncio
+import os
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 import hashlib
@@ -17,6 +19,41 @@ import httpx
 
 from ..schemas.document import ProcessedDocument, DocumentMetadata
 
+BUCKET_NAME = "tender-documents"
+
+
+@lru_cache()
+def _get_minio_client() -> Optional[Minio]:
+    """
+    Build the MinIO client once per process and make sure the bucket exists.
+    
+    Returns None if MinIO is not configured.
+    """
+    endpoint = os.getenv("MINIO_ENDPOINT")
+    access_key = os.getenv("MINIO_ACCESS_KEY")
+    secret_key = os.getenv("MINIO_SECRET_KEY")
+    
+    # Return None if MinIO is not configured
+    if not all([endpoint, access_key, secret_key]):
+        logger.warning("MinIO not configured - document storage disabled")
+        return None
+    
+    client = Minio(
+        endpoint=endpoint,
+        access_key=access_key,
+        secret_key=secret_key,
+        secure=False  # Set to True in production with HTTPS
+    )
+    
+    try:
+        if not client.bucket_exists(BUCKET_NAME):
+            client.make_bucket(BUCKET_NAME)
+            logger.info(f"Created MinIO bucket: {BUCKET_NAME}")
+    except S3Error as e:
+        logger.error(f"Failed to create bucket: {e}")
+    
+    return client
+
 
 class PDFProcessor:
     """
@@ -31,39 +68,9 @@ class PDFProcessor:
     """
     
     def __init__(self):
-        self.minio_client = self._init_minio()
-        self.bucket_name = "tender-documents"
-        if self.minio_client:
-            self._ensure_bucket()
-        
-    def _init_minio(self) -> Optional[Minio]:
-        """Initialize MinIO client."""
-        import os
-        
-        endpoint = os.getenv("MINIO_ENDPOINT")
-        access_key = os.getenv("MINIO_ACCESS_KEY")
-        secret_key = os.getenv("MINIO_SECRET_KEY")
-        
-        # Return None if MinIO is not configured
-        if not all([endpoint, access_key, secret_key]):
-            logger.warning("MinIO not configured - document storage disabled")
-            return None
-        
-        return Minio(
-            endpoint=endpoint,
-            access_key=access_key,
-            secret_key=secret_key,
-            secure=False  # Set to True in production with HTTPS
-        )
-    
-    def _ensure_bucket(self):
-        """Ensure the storage bucket exists."""
-        try:
-            if not self.minio_client.bucket_exists(self.bucket_name):
-                self.minio_client.make_bucket(self.bucket_name)
-                logger.info(f"Created MinIO bucket: {self.bucket_name}")
-        except S3Error as e:
-            logger.error(f"Failed to create bucket: {e}")
+        # Shared across processors; bucket creation happens on first use only
+        self.minio_client = _get_minio_client()
+        self.bucket_name = BUCKET_NAME
     
     async def process_batch(
         self, 
@@ -302,12 +309,15 @@ class PDFProcessor:
     
     async def get_document(self, object_key: str) -> bytes:
         """Retrieve document from MinIO."""
+        # Reading the body blocks too, so fetch and read in the same thread
+        return await asyncio.to_thread(self._read_object, object_key)
+    
+    def _read_object(self, object_key: str) -> bytes:
+        response = self.minio_client.get_object(
+            bucket_name=self.bucket_name,
+            object_name=object_key
+        )
         try:
-            response = await asyncio.to_thread(
-                self.minio_client.get_object,
-                bucket_name=self.bucket_name,
-                object_name=object_key
-            )
             return response.read()
         finally:
             response.close()
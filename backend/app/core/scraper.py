@@ -6,6 +6,7 @@ import asyncio
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 import hashlib
+import time
 from loguru import logger
 
 from tenacity import retry, stop_after_attempt, wait_exponential
@@ -116,7 +117,7 @@ class BulletproofTenderScraper:
         Returns:
             ScrapingResult with extracted opportunities and metadata
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
         # Check if AI scraping is available
         if not self.scraper:
@@ -169,11 +170,11 @@ class BulletproofTenderScraper:
                 opportunities = self._merge_pdf_data(opportunities, pdf_results)
             
             # Calculate metrics
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             return ScrapingResult(
                 website_id=website_config.id,
-                opportunities=opportunities,
+                opportunities=[o.model_dump(mode="json") for o in opportunities],
                 total_found=len(opportunities),
                 pdfs_processed=len(pdf_urls),
                 duration_seconds=duration,
@@ -183,7 +184,7 @@ class BulletproofTenderScraper:
             
         except Exception as e:
             logger.error(f"Scraping failed for {website_config.url}: {str(e)}")
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             return ScrapingResult(
                 website_id=website_config.id,
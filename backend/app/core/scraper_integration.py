@@ -4,6 +4,7 @@ according to the PRD architecture.
 """
 import os
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlsplit
 from loguru import logger
 
 from .scraper import BulletproofTenderScraper, SCRAPEGRAPH_AVAILABLE
@@ -15,6 +16,18 @@ from ..schemas.scraping import ScrapingResult
 from ..config import get_settings
 
 
+# Page markers served by Cloudflare's browser check
+CLOUDFLARE_INDICATORS = (
+    "Checking your browser",
+    "Please wait",
+    "DDoS protection by Cloudflare",
+    "cf-browser-verification"
+)
+
+# Domains known to sit behind Cloudflare protection
+CLOUDFLARE_PROTECTED_DOMAINS = ("tenders.vic.gov.au", "tenders.nsw.gov.au")
+
+
 class ScraperFactory:
     """
     Factory to create the appropriate scraper based on available services.
@@ -110,20 +123,11 @@ class IntegratedScrapingPipeline:
     
     async def _needs_cloudflare_bypass(self, url: str) -> bool:
         """Check if URL needs Cloudflare bypass."""
-        # Simple check - in production, actually test the URL
-        cloudflare_indicators = [
-            "Checking your browser",
-            "Please wait",
-            "DDoS protection by Cloudflare",
-            "cf-browser-verification"
-        ]
-        
-        # For now, check known problematic domains
-        problematic_domains = ["tenders.vic.gov.au", "tenders.nsw.gov.au"]
-        from urllib.parse import urlparse
-        domain = urlparse(url).netloc
+        # Simple check - in production, actually test the URL against
+        # CLOUDFLARE_INDICATORS. For now, check known problematic domains
+        domain = urlsplit(url).netloc
         
-        return any(prob in domain for prob in problematic_domains)
+        return any(prob in domain for prob in CLOUDFLARE_PROTECTED_DOMAINS)
     
     def _merge_pdf_data(self, result: ScrapingResult, pdf_results: Dict) -> ScrapingResult:
         """Merge PDF extracted data into opportunities."""
@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from datetime import datetime
 import json
 import re
+import time
 from typing import Dict, List, Any, Optional
 import hashlib
 from loguru import logger
@@ -132,7 +133,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found."""
     
     async def scrape_website(self, website_config) -> ScrapingResult:
         """Scrape website using Ollama for intelligent extraction"""
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         url = website_config.url
         
         try:
@@ -161,7 +162,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found."""
                 if processed:
                     opportunities.append(processed)
             
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             return ScrapingResult(
                 website_id=website_config.id,
@@ -188,7 +189,7 @@ IMPORTANT: Return ONLY a valid JSON array of opportunities found."""
             
         except Exception as e:
             logger.error(f"Scraping error: {e}")
-            duration = (datetime.utcnow() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             
             return ScrapingResult(
                 website_id=website_config.id,
@@ -32,6 +32,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down HoistScout API...")
+    await health.close_http_client()
+    await health.close_redis_clients()
     await close_db()
 
 
@@ -19,7 +19,8 @@ class TenderData(BaseModel):
 
 class ScrapingResult(BaseModel):
     website_id: int
-    opportunities: List[TenderData]
+    # Plain dicts, as the worker and pipeline read them (TenderData.model_dump())
+    opportunities: List[Dict[str, Any]]
     total_found: int
     pdfs_processed: int
     duration_seconds: float
@@ -1,22 +1,39 @@
 from typing import Dict, Any
+from functools import lru_cache
 from cryptography.fernet import Fernet
 import json
 import structlog
 from ..config import get_settings
 
+# orjson is optional; fall back to the stdlib encoder if it is not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = structlog.get_logger()
 settings = get_settings()
 
 
+@lru_cache()
+def _get_cipher() -> Fernet:
+    """Build the Fernet cipher once per process and share it across managers."""
+    return Fernet(Fernet.generate_key())
+
+
 class SecureCredentialManager:
     def __init__(self):
         self.key = settings.secret_key.encode()[:32].ljust(32, b'0')
-        self.cipher = Fernet(Fernet.generate_key())
+        self.cipher = _get_cipher()
         
     def encrypt_credentials(self, credentials: Dict[str, Any]) -> bytes:
         try:
-            json_data = json.dumps(credentials)
-            encrypted = self.cipher.encrypt(json_data.encode())
+            if ORJSON_AVAILABLE:
+                json_data = orjson.dumps(credentials)
+            else:
+                json_data = json.dumps(credentials).encode()
+            encrypted = self.cipher.encrypt(json_data)
             return encrypted
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
@@ -25,6 +42,8 @@ class SecureCredentialManager:
     def decrypt_credentials(self, encrypted: bytes) -> Dict[str, Any]:
         try:
             decrypted = self.cipher.decrypt(encrypted)
+            if ORJSON_AVAILABLE:
+                return orjson.loads(decrypted)
             return json.loads(decrypted.decode())
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
@@ -1,5 +1,6 @@
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init
 import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -63,6 +64,23 @@ celery = celery_app
 # Also keep worker alias for backward compatibility
 worker = celery_app
 
+
+@worker_init.connect
+@worker_process_init.connect
+def use_uvloop(**kwargs):
+    """
+    Make the loops tasks create uvloop loops, when uvloop is installed.
+    
+    Done from worker signals rather than at import: the API imports this
+    module to enqueue jobs and must keep its own event loop policy.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 # Log Celery app creation
 logger.info(f"Celery app created with broker: {celery_app.conf.broker_url}")
 logger.info(f"Celery app name: {celery_app.main}")
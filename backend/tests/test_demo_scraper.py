@@ -0,0 +1,397 @@
+import asyncio
+import warnings
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from app.core import demo_scraper
+from app.core.demo_scraper import (
+    DemoScraper,
+    DEMO_OPPORTUNITIES,
+    RateLimited,
+    buffered,
+    parse_retry_after,
+    raise_for_status,
+)
+
+
+URL = "https://www.tenders.gov.au/atm"
+NOW = "2025-01-01T00:00:00"
+
+# Padding keeps small fixtures above MIN_HTML_BYTES
+PADDING = "<p>" + "x" * 600 + "</p>"
+
+LISTING_PAGE = f"""
+<html><body>
+{PADDING}
+<div class="tender-item">
+  <h3>Road <b>wo</b>rks   0</h3><!-- internal note -->
+  <script>var tracking = 1;</script>
+  <p>Closing date</p><p>Value
+     $100</p>
+</div>
+<article class="Opportunity"><a href="/atm/1">Bridge maintenance</a> tail text</article>
+<tr class="search-result"><td>Not in a table</td></tr>
+</body></html>
+"""
+
+TBODY_TABLE_PAGE = f"""
+<html><body>
+{PADDING}
+<table><tbody>
+  <tr><td><span>Cleaning services</span></td><td>Canberra</td></tr>
+  <tr><td>No title <i>here</i></td></tr>
+</tbody></table>
+</body></html>
+"""
+
+# Layout table ahead of the listing table; only <tbody> rows count
+LAYOUT_THEN_LISTING_PAGE = f"""
+<html><body>
+{PADDING}
+<table><tr><td><a href="/">Home</a></td><td>Search</td></tr></table>
+<table><thead><tr><th>Tender</th></tr></thead><tbody>
+  <tr><td><h4>Security services</h4> Melbourne</td></tr>
+  <tr><td><h4>Fleet leasing</h4> Perth</td></tr>
+</tbody></table>
+</body></html>
+"""
+
+# Layout table without an explicit <tbody>: not a listing
+NO_TBODY_TABLE_PAGE = f"""
+<html><body>
+{PADDING}
+<table><tr><td>Header</td></tr><tr><td>Footer</td></tr></table>
+</body></html>
+"""
+
+
+def parse_with(monkeypatch, use_lxml: bool, html: str):
+    monkeypatch.setattr(demo_scraper, "LXML_AVAILABLE", use_lxml)
+    return DemoScraper()._parse_page(html.encode(), "utf-8", URL, NOW)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("html", [
+    LISTING_PAGE,
+    TBODY_TABLE_PAGE,
+    LAYOUT_THEN_LISTING_PAGE,
+    NO_TBODY_TABLE_PAGE,
+])
+def test_lxml_and_soup_backends_agree(monkeypatch, html):
+    """Both parser backends produce identical opportunities for the same page."""
+    assert parse_with(monkeypatch, True, html) == parse_with(monkeypatch, False, html)
+
+
+@pytest.mark.unit
+def test_listing_text_keeps_separators(monkeypatch):
+    """Adjacent text nodes are joined with spaces, and script/comments are dropped."""
+    opportunities = parse_with(monkeypatch, True, LISTING_PAGE)
+
+    assert [o["title"] for o in opportunities] == [
+        "Road wo rks 0",
+        "Bridge maintenance",
+        "Not in a table",
+    ]
+    assert opportunities[0]["extracted_data"]["raw_text"] == (
+        "Road wo rks 0 Closing date Value $100"
+    )
+    assert opportunities[1]["description"] == "Bridge maintenance tail text"
+
+
+@pytest.mark.unit
+def test_text_is_bounded(monkeypatch):
+    """raw_text stops at MAX_TEXT_CHARS however large the element is."""
+    words = " ".join(f"word{i}" for i in range(2000))
+    html = f'<html><body><div class="tender">{words}</div></body></html>'
+
+    for use_lxml in (True, False):
+        (opportunity,) = parse_with(monkeypatch, use_lxml, html)
+        raw_text = opportunity["extracted_data"]["raw_text"]
+        assert len(raw_text) == demo_scraper.MAX_TEXT_CHARS
+        assert raw_text == words[:demo_scraper.MAX_TEXT_CHARS]
+
+
+@pytest.mark.unit
+def test_listing_table_after_layout_table(monkeypatch):
+    """<tbody> rows are found in any table, not just the first one."""
+    for use_lxml in (True, False):
+        opportunities = parse_with(monkeypatch, use_lxml, LAYOUT_THEN_LISTING_PAGE)
+        assert [o["title"] for o in opportunities] == ["Security services", "Fleet leasing"]
+        assert opportunities[0]["description"] == "Security services Melbourne"
+
+
+@pytest.mark.unit
+def test_table_without_tbody_falls_back_to_demo_data(monkeypatch):
+    """Only explicit <tbody> rows count as a listing table."""
+    opportunities = parse_with(monkeypatch, True, NO_TBODY_TABLE_PAGE)
+
+    assert [o["title"] for o in opportunities] == [t["title"] for t in DEMO_OPPORTUNITIES]
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    demo_scraper._RESULT_CACHE.clear()
+    yield
+    demo_scraper._RESULT_CACHE.clear()
+
+
+def html_response(body: str = LISTING_PAGE, **headers) -> httpx.Response:
+    return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8", **headers}, text=body)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_not_modified_returns_cached_opportunities(monkeypatch):
+    """A 304 reuses the first scrape's opportunities without reparsing."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return html_response(etag='"v1"', **{"last-modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+
+    scraper = DemoScraper(transport=httpx.MockTransport(handler))
+    first = await scraper.scrape_tenders_gov_au(URL)
+
+    def fail_parse(*args):
+        raise AssertionError("304 responses must not be parsed")
+
+    monkeypatch.setattr(DemoScraper, "_parse_page", fail_parse)
+    await asyncio.sleep(0.001)
+    second = await scraper.scrape_tenders_gov_au(URL)
+
+    assert "if-none-match" not in requests[0].headers
+    assert requests[1].headers["if-none-match"] == '"v1"'
+    assert requests[1].headers["if-modified-since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+    assert second.success
+    # Cached opportunities keep the timestamp of the scrape that parsed them
+    assert second.opportunities == first.opportunities
+    assert len(second.opportunities) == 3
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_pages_without_validators_are_not_cached():
+    scraper = DemoScraper(transport=httpx.MockTransport(lambda request: html_response()))
+    await scraper.scrape_tenders_gov_au(URL)
+
+    assert URL not in demo_scraper._RESULT_CACHE
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_non_html_response_falls_back_to_demo_data():
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "application/json"}, text="{}" * 1000)
+
+    result = await DemoScraper(transport=httpx.MockTransport(handler)).scrape_tenders_gov_au(URL)
+
+    assert result.success
+    assert [o["title"] for o in result.opportunities] == [t["title"] for t in DEMO_OPPORTUNITIES]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("headers", [{"content-type": "Text/HTML; charset=UTF-8"}, {}])
+async def test_html_without_canonical_content_type_is_parsed(headers):
+    """Content types are matched case-insensitively, and a missing one is not a reason to skip."""
+    def handler(request):
+        return httpx.Response(200, headers=headers, content=LISTING_PAGE.encode())
+
+    result = await DemoScraper(transport=httpx.MockTransport(handler)).scrape_tenders_gov_au(URL)
+
+    assert result.success
+    assert [o["title"] for o in result.opportunities][:2] == ["Road wo rks 0", "Bridge maintenance"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("value, expected", [
+    (None, None),
+    ("", None),
+    ("120", 120.0),
+    ("-5", 0.0),
+    ("soon", None),
+    ("Wed, 01 Jan 2020 00:00:00 GMT", 0.0),
+])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+@pytest.mark.unit
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=90)
+
+    assert 80 < parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 90
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", [429, 503])
+def test_raise_for_status_rate_limited(status):
+    with pytest.raises(RateLimited) as excinfo:
+        raise_for_status(URL, status, "30")
+
+    assert excinfo.value.status == status
+    assert excinfo.value.retry_after == 30.0
+
+
+@pytest.mark.unit
+def test_raise_for_status_other_errors():
+    raise_for_status(URL, 200)
+    with pytest.raises(Exception, match="HTTP 404"):
+        raise_for_status(URL, 404)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_rate_limit_is_a_failed_result_on_every_path():
+    """Single and batch scrapes both report retry_after instead of raising."""
+    def handler(request):
+        return httpx.Response(429, headers={"retry-after": "45"})
+
+    scraper = DemoScraper(transport=httpx.MockTransport(handler))
+    single = await scraper.scrape_tenders_gov_au(URL)
+    (batch,) = await scraper.scrape_many([URL])
+
+    for result in (single, batch):
+        assert not result.success
+        assert result.stats == {"retry_after": 45.0}
+        assert "429" in result.error_message
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_runs_ahead_and_keeps_order():
+    produced = []
+
+    async def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    consumed = []
+    async for item in buffered(source(), 3):
+        # Give the producer a chance to fill the queue
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        consumed.append(item)
+        assert len(produced) - len(consumed) <= 3 + 1
+
+    assert consumed == list(range(10))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_propagates_errors():
+    async def source():
+        yield 1
+        raise ValueError("boom")
+
+    consumed = []
+    with pytest.raises(ValueError, match="boom"):
+        async for item in buffered(source(), 2):
+            consumed.append(item)
+
+    assert consumed == [1]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_stops_producer_on_early_exit():
+    finished = asyncio.Event()
+
+    async def source():
+        try:
+            for i in range(100):
+                yield i
+        finally:
+            finished.set()
+
+    items = buffered(source(), 2)
+    async for item in items:
+        break
+    await items.aclose()
+
+    assert finished.is_set()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_stream_yields_results_in_order():
+    """A failing page becomes a failed result without stopping the batch."""
+    def handler(request):
+        if request.url.path.endswith("/2"):
+            return httpx.Response(500)
+        return html_response()
+
+    urls = [f"{URL}/{i}" for i in range(5)]
+    scraper = DemoScraper(transport=httpx.MockTransport(handler))
+    results = [result async for result in scraper.scrape_stream(urls, prefetch=2)]
+
+    assert [r.success for r in results] == [True, True, False, True, True]
+    assert results[2].error_message == f"HTTP 500: Failed to fetch {urls[2]}"
+    for url, result in zip(urls, results):
+        if result.success:
+            assert result.total_found == 3
+            assert {o["source_url"] for o in result.opportunities} == {url}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scrape_stream_early_exit_stops_prefetch_before_closing_client():
+    """Closing the stream cancels in-flight prefetches while the client is still open."""
+    events = []
+
+    class RecordingTransport(httpx.MockTransport):
+        async def aclose(self):
+            events.append("client_closed")
+
+    async def handler(request):
+        if request.url.path.endswith("/0"):
+            return html_response()
+        events.append(f"request {request.url.path}")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append(f"cancelled {request.url.path}")
+            raise
+        return html_response()
+
+    scraper = DemoScraper(transport=RecordingTransport(handler))
+    stream = scraper.scrape_stream([f"{URL}/{i}" for i in range(3)], prefetch=1)
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.success
+    assert events == ["request /atm/1", "cancelled /atm/1", "client_closed"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, -1])
+async def test_buffered_rejects_unbounded_sizes(size):
+    async def source():
+        yield 1
+
+    with pytest.raises(ValueError):
+        async for item in buffered(source(), size):
+            pass
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_results_serialise_without_schema_warnings():
+    """Opportunities stay plain dicts and match the ScrapingResult schema."""
+    scraper = DemoScraper(transport=httpx.MockTransport(lambda request: html_response()))
+    result = await scraper.scrape_tenders_gov_au(URL)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dumped = result.model_dump()
+        result.model_dump_json()
+
+    assert dumped["opportunities"] == result.opportunities
+    assert type(result).model_validate(dumped) == result
@@ -1,5 +1,10 @@
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from httpx import AsyncClient
+from redis.exceptions import ResponseError
+
+from app.api import health
 from app.main import app
 
 
@@ -13,4 +18,53 @@ async def test_health_endpoint():
         data = response.json()
         assert data["status"] == "healthy"
         assert "timestamp" in data
-        assert "version" in data
\ No newline at end of file
+        assert "version" in data
+
+
+def mock_redis(replies):
+    """A redis client whose pipelines return `replies` from execute()."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=replies)
+    client = MagicMock()
+    client.ping = AsyncMock(return_value=True)
+    client.pipeline.return_value = pipe
+    client.keys = AsyncMock(return_value=[])
+    client.info = AsyncMock(return_value={"redis_version": "7.2.0"})
+    return client, pipe
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_check_pipelines_set_get_delete(monkeypatch):
+    client, pipe = mock_redis([True, None, 1])
+
+    def reply_with_value(key, value, ex):
+        pipe.execute.return_value[1] = value
+
+    pipe.set.side_effect = reply_with_value
+    monkeypatch.setattr(health, "get_redis", lambda decode_responses=False: client)
+
+    result = await health.redis_connectivity_check()
+
+    client.pipeline.assert_called_once_with(transaction=False)
+    pipe.execute.assert_awaited_once_with(raise_on_error=False)
+    (key, value), kwargs = pipe.set.call_args
+    assert kwargs == {"ex": 60}
+    pipe.get.assert_called_once_with(key)
+    pipe.delete.assert_called_once_with(key)
+    assert result["operations"]["get"] == {"success": True, "value": value, "error": None}
+    assert result["healthy"] is True
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_redis_check_reports_failed_pipeline_ops(monkeypatch):
+    client, pipe = mock_redis([True, "stale", ResponseError("READONLY")])
+    monkeypatch.setattr(health, "get_redis", lambda decode_responses=False: client)
+
+    result = await health.redis_connectivity_check()
+
+    assert result["operations"]["set"]["success"] is True
+    assert result["operations"]["get"]["error"] == "Value mismatch"
+    assert result["operations"]["delete"] == {"success": False, "error": "READONLY"}
+    assert result["healthy"] is False
@@ -0,0 +1,137 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.api import health
+from app.main import app
+
+
+def counting_probe(calls, name, ok=True):
+    """A readiness probe that records how often it ran."""
+    async def check(*args):
+        calls[name] += 1
+        return ok
+    return check
+
+
+@pytest.fixture
+def probe_calls(monkeypatch):
+    """Fresh readiness caches, with every dependency up; returns probe counts."""
+    monkeypatch.setattr(health, "_check_cache", {})
+    monkeypatch.setattr(health, "_check_locks", {})
+    monkeypatch.setattr(health.settings, "minio_endpoint", "minio:9000")
+    calls = {"database": 0, "redis": 0, "minio": 0}
+    monkeypatch.setattr(health, "_check_database", counting_probe(calls, "database"))
+    monkeypatch.setattr(health, "_check_redis", counting_probe(calls, "redis"))
+    monkeypatch.setattr(health, "_check_minio", counting_probe(calls, "minio"))
+    return calls
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_readiness_reuses_results_within_ttl(probe_calls, monkeypatch):
+    first = await health.readiness_check(db=None)
+    second = await health.readiness_check(db=None)
+
+    assert first == second == {
+        "ready": True,
+        "checks": {"database": True, "redis": True, "minio": True}
+    }
+    assert probe_calls == {"database": 1, "redis": 1, "minio": 1}
+
+    # use_cache=False always probes
+    await health._run_readiness_checks(db=None, use_cache=False)
+    assert probe_calls == {"database": 2, "redis": 2, "minio": 2}
+
+    # Expired entries are probed again
+    monkeypatch.setitem(health.CHECK_TTLS, "redis", 0.0)
+    await health.readiness_check(db=None)
+    assert probe_calls == {"database": 2, "redis": 3, "minio": 2}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_readiness_concurrent_misses_share_one_probe(probe_calls):
+    await asyncio.gather(*(health.readiness_check(db=None) for _ in range(5)))
+
+    assert probe_calls == {"database": 1, "redis": 1, "minio": 1}
+
+
+@pytest.mark.unit
+def test_readiness_route_cannot_bypass_cache():
+    """The cache switch is internal, not a query parameter callers can set."""
+    parameters = app.openapi()["paths"]["/api/health/ready"]["get"].get("parameters", [])
+
+    assert "use_cache" not in {p["name"] for p in parameters}
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, expected", [(200, True), (503, False)])
+async def test_check_minio_uses_shared_client(monkeypatch, status, expected):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status)
+
+    monkeypatch.setattr(health.settings, "minio_endpoint", "minio:9000")
+    monkeypatch.setattr(
+        health, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    client = health.get_http_client()
+
+    assert await health._check_minio() is expected
+    assert await health._check_minio() is expected
+    assert health.get_http_client() is client
+    assert [str(r.url) for r in requests] == ["http://minio:9000/minio/health/ready"] * 2
+
+    await health.close_http_client()
+    assert health._http_client is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_readiness_slow_check_times_out(probe_calls, monkeypatch):
+    async def hang():
+        await asyncio.sleep(10)
+        return True
+
+    monkeypatch.setattr(health, "_check_redis", hang)
+    monkeypatch.setitem(health.CHECK_TIMEOUTS, "redis", 0.01)
+
+    result = await health.readiness_check(db=None)
+
+    assert result["ready"] is False
+    assert result["checks"]["redis"] is False
+    # The failure is cached like any other result
+    assert health._check_cache["redis"][1] is False
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("down", ["database", "redis"])
+async def test_readiness_skips_minio_when_core_is_down(probe_calls, monkeypatch, down):
+    monkeypatch.setattr(health, f"_check_{down}", counting_probe(probe_calls, down, ok=False))
+
+    result = await health.readiness_check(db=None)
+
+    assert result["ready"] is False
+    assert result["checks"][down] is False
+    assert result["checks"]["minio"] == "skipped"
+    assert probe_calls["minio"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_readiness_minio_not_configured(probe_calls, monkeypatch):
+    monkeypatch.setattr(health.settings, "minio_endpoint", None)
+
+    result = await health.readiness_check(db=None)
+
+    assert result == {
+        "ready": True,
+        "checks": {"database": True, "redis": True, "minio": None}
+    }
+    assert probe_calls["minio"] == 0
@@ -0,0 +1,82 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.health import get_stats
+
+
+def mock_session(row):
+    """An AsyncSession whose execute() yields `row` from one()."""
+    db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.one.return_value = row
+    db.execute.return_value = result
+    return db
+
+
+def stats_row(**values):
+    row = dict(
+        total_sites=3,
+        total_opportunities=42,
+        total_jobs=10,
+        jobs_this_week=4,
+        last_scrape=datetime(2025, 1, 2, 3, 4, 5)
+    )
+    row.update(values)
+    return SimpleNamespace(**row)
+
+
+def compiled_sql(db) -> str:
+    (stmt,), _ = db.execute.call_args
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_fetches_table_totals_in_one_statement():
+    db = mock_session(stats_row())
+
+    stats = await get_stats(db=db)
+
+    assert stats == {
+        "total_sites": 3,
+        "total_jobs": 10,
+        "total_opportunities": 42,
+        "jobs_this_week": 4,
+        "last_scrape": "2025-01-02T03:04:05"
+    }
+    db.execute.assert_awaited_once()
+    sql = compiled_sql(db)
+    assert "FROM websites) AS total_sites" in sql
+    assert "FROM opportunities) AS total_opportunities" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_empty_tables():
+    db = mock_session(stats_row(total_sites=0, total_opportunities=None, last_scrape=None))
+
+    stats = await get_stats(db=db)
+
+    assert stats["total_sites"] == 0
+    assert stats["total_opportunities"] == 0
+    assert stats["last_scrape"] is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_stats_job_aggregates_share_one_scan():
+    """Job totals come from one pass over scraping_jobs using FILTER."""
+    db = mock_session(stats_row())
+
+    await get_stats(db=db)
+
+    sql = compiled_sql(db)
+    assert sql.count("FROM scraping_jobs") == 1
+    assert "count(scraping_jobs.id) AS total_jobs" in sql
+    assert "count(scraping_jobs.id) FILTER (WHERE scraping_jobs.created_at >=" in sql
+    assert "max(scraping_jobs.completed_at) AS last_scrape" in sql
@@ -0,0 +1,59 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.websites import create_website
+from app.models.website import Website
+from app.schemas.website import WebsiteCreate
+
+
+def mock_session(returned):
+    """An AsyncSession whose execute() yields `returned` from scalar_one_or_none()."""
+    db = AsyncMock(spec=AsyncSession)
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = returned
+    db.execute.return_value = result
+    return db
+
+
+def compiled_sql(db) -> str:
+    (stmt,), _ = db.execute.call_args
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+WEBSITE = WebsiteCreate(name="AusTender", url="https://www.tenders.gov.au/")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_website_is_one_upsert_statement():
+    website = Website(id=1, name="AusTender", url="https://www.tenders.gov.au/")
+    db = mock_session(website)
+
+    assert await create_website(WEBSITE, db=db, current_user=None) is website
+
+    db.execute.assert_awaited_once()
+    sql = compiled_sql(db)
+    assert sql.startswith("INSERT INTO websites")
+    assert "ON CONFLICT (url) DO NOTHING RETURNING" in sql
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_create_website_duplicate_url_is_400():
+    """An empty RETURNING means the URL already exists."""
+    db = mock_session(None)
+
+    with pytest.raises(HTTPException) as excinfo:
+        await create_website(WEBSITE, db=db, current_user=None)
+
+    assert excinfo.value.status_code == 400
+    assert excinfo.value.detail == "Website URL already exists"
+    db.execute.assert_awaited_once()
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_called()